@@ -1,7 +1,7 @@
 """The Octopus French Energy integration."""
 
+import asyncio
 import logging
-from contextlib import suppress
 from dataclasses import dataclass, field
 
 import voluptuous as vol
@@ -48,6 +48,8 @@ type OctopusFrenchConfigEntry = ConfigEntry[OctopusFrenchRuntimeData]
 
 _LOGGER = logging.getLogger(__name__)
 
+_KVA = UnitOfApparentPower.KILO_VOLT_AMPERE
+
 PLATFORMS: list[Platform] = [
     Platform.BINARY_SENSOR,
     Platform.NUMBER,
@@ -61,12 +63,16 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Octopus French Energy integration."""
 
     async def handle_force_update(call: ServiceCall) -> None:
+        # Les comptes sont indépendants : rafraîchir en parallèle plutôt que
+        # d'enchaîner les allers-retours réseau.
+        refreshes = []
         for entry in hass.config_entries.async_entries(DOMAIN):
             if entry.state is ConfigEntryState.LOADED:
-                await entry.runtime_data.coordinator.async_request_refresh()
+                refreshes.append(entry.runtime_data.coordinator.async_request_refresh())
                 intelligent = entry.runtime_data.intelligent_coordinator
                 if intelligent is not None:
-                    await intelligent.async_request_refresh()
+                    refreshes.append(intelligent.async_request_refresh())
+        await asyncio.gather(*refreshes)
 
     hass.services.async_register(
         DOMAIN,
@@ -205,8 +211,13 @@ async def _async_setup_intelligent_coordinator(
     except ConfigEntryAuthFailed:
         # Une erreur d'authentification doit déclencher le flow de réauthentification.
         raise
-    except Exception as err:
-        _LOGGER.debug("Octopus Intelligent not available for this account: %s", err)
+    except ConfigEntryNotReady as err:
+        # Le premier refresh convertit toute erreur de mise à jour en
+        # ConfigEntryNotReady : c'est le seul signal « Intelligent absent ».
+        _LOGGER.debug(
+            "Octopus Intelligent not available for this account: %s",
+            err.__cause__ or err,
+        )
         return None
 
 
@@ -214,28 +225,30 @@ async def _async_get_account_number(
     api_client: OctopusFrenchApiClient, configured_account: str
 ) -> str:
     """Get and validate account number."""
-    with suppress(OctopusConnectionError, KeyError, IndexError, TypeError):
+    try:
         accounts = await api_client.get_accounts()
-        if not accounts:
-            return configured_account or ""
-
-        account_numbers = [account["number"] for account in accounts]
-
-        if configured_account:
-            if configured_account in account_numbers:
-                return configured_account
-            # Ne jamais basculer silencieusement sur un autre compte : l'unique_id
-            # de l'entry est le numéro configuré, les entités garderaient donc son
-            # identité tout en exposant les données d'un autre compte.
-            raise ConfigEntryError(
-                f"Account {configured_account} is no longer available on this "
-                "Octopus Energy login"
-            )
-
-        if account_numbers:
-            return account_numbers[0]
+    except OctopusConnectionError as err:
+        # Transitoire : laisser HA retenter avec backoff plutôt que de continuer
+        # avec un compte non vérifié et d'échouer au premier refresh.
+        raise ConfigEntryNotReady(f"Cannot fetch Octopus accounts: {err}") from err
+
+    if not accounts:
+        return configured_account or ""
+
+    account_numbers = [account["number"] for account in accounts]
+
+    if configured_account:
+        if configured_account in account_numbers:
+            return configured_account
+        # Ne jamais basculer silencieusement sur un autre compte : l'unique_id
+        # de l'entry est le numéro configuré, les entités garderaient donc son
+        # identité tout en exposant les données d'un autre compte.
+        raise ConfigEntryError(
+            f"Account {configured_account} is no longer available on this "
+            "Octopus Energy login"
+        )
 
-    return configured_account or ""
+    return account_numbers[0]
 
 
 async def _async_create_devices(
@@ -245,48 +258,90 @@ async def _async_create_devices(
     account_number: str,
 ) -> None:
     """Create devices for all meters."""
+    supply_points = coordinator.data.get("supply_points") or {}
+    elec_meters = supply_points.get("electricity") or []
+    gas_meters = supply_points.get("gas") or []
+    if not account_number and not elec_meters and not gas_meters:
+        return
+
     device_registry = dr.async_get(hass)
-    supply_points = coordinator.data.get("supply_points", {})
+    entry_id = entry.entry_id
 
     if account_number:
-        device_registry.async_get_or_create(
-            config_entry_id=entry.entry_id,
-            identifiers={(DOMAIN, str(account_number))},
+        _async_ensure_device(
+            device_registry,
+            entry_id,
+            str(account_number),
             name="Compte Octopus Energy",
             manufacturer="Octopus Energy France",
             model="Compte client",
         )
 
-    for elec_meter in supply_points.get("electricity", []):
+    # Les compteurs résiliés sont déjà écartés par le coordinator.
+    for elec_meter in elec_meters:
         prm_id = elec_meter.get("prm")
         if not prm_id:
             continue
+        prm_str = str(prm_id)
 
         meter_kind = elec_meter.get("meterKind", "N/A")
         suscribed_max_power = elec_meter.get("subscribedMaxPower", "N/A")
-        device_registry.async_get_or_create(
-            config_entry_id=entry.entry_id,
-            identifiers={(DOMAIN, str(prm_id))},
-            name=f"{meter_kind} {prm_id}",
+        _async_ensure_device(
+            device_registry,
+            entry_id,
+            prm_str,
+            name=f"{meter_kind} {prm_str}",
             manufacturer="Enedis",
-            model=f"{elec_meter.get('meterKind', 'N/A')} - {suscribed_max_power} {UnitOfApparentPower.KILO_VOLT_AMPERE}",
+            model=f"{meter_kind} - {suscribed_max_power} {_KVA}",
         )
 
-    for gas_meter in supply_points.get("gas", []):
+    for gas_meter in gas_meters:
         pce_ref = gas_meter.get("prm")
         if not pce_ref:
             continue
+        pce_str = str(pce_ref)
 
         is_smart = gas_meter.get("isSmartMeter", False)
-        device_registry.async_get_or_create(
-            config_entry_id=entry.entry_id,
-            identifiers={(DOMAIN, str(pce_ref))},
-            name=f"Gazpar {pce_ref}",
+        _async_ensure_device(
+            device_registry,
+            entry_id,
+            pce_str,
+            name=f"Gazpar {pce_str}",
             manufacturer="GrDF",
             model="Gazpar" if is_smart else "Compteur gaz traditionnel",
         )
 
 
+@callback
+def _async_ensure_device(
+    device_registry: dr.DeviceRegistry,
+    entry_id: str,
+    identifier: str,
+    *,
+    name: str,
+    manufacturer: str,
+    model: str,
+) -> None:
+    """Create or update a device, skipping the registry write when unchanged."""
+    existing = device_registry.async_get_device(identifiers={(DOMAIN, identifier)})
+    if (
+        existing is not None
+        and entry_id in existing.config_entries
+        and existing.name == name
+        and existing.manufacturer == manufacturer
+        and existing.model == model
+    ):
+        return
+
+    device_registry.async_get_or_create(
+        config_entry_id=entry_id,
+        identifiers={(DOMAIN, identifier)},
+        name=name,
+        manufacturer=manufacturer,
+        model=model,
+    )
+
+
 async def _async_create_intelligent_devices(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -1,6 +1,6 @@
 """Binary sensors for OctopusFrench Energy integration."""
 
-from datetime import datetime, time
+from datetime import datetime, timedelta
 from typing import Any
 
 from homeassistant.components.binary_sensor import (
@@ -8,10 +8,10 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_time_change
+from homeassistant.helpers.event import async_track_point_in_time
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
@@ -21,6 +21,8 @@ from .utils import get_tempo_color_for_prm, resolve_hc_schedule
 
 PARALLEL_UPDATES = 0
 
+MINUTES_PER_DAY = 24 * 60
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -54,6 +56,7 @@ async def async_setup_entry(
                 OctopusFrenchHcBinarySensor(
                     coordinator=coordinator,
                     prm_id=prm_id,
+                    schedule=schedule,
                 )
             )
 
@@ -77,7 +80,10 @@ class OctopusFrenchHcBinarySensor(
     _attr_device_class = BinarySensorDeviceClass.RUNNING
 
     def __init__(
-        self, coordinator: OctopusFrenchDataUpdateCoordinator, prm_id: str
+        self,
+        coordinator: OctopusFrenchDataUpdateCoordinator,
+        prm_id: str,
+        schedule: dict[str, Any],
     ) -> None:
         """Initialize the HC binary sensor."""
         super().__init__(coordinator)
@@ -87,43 +93,101 @@ class OctopusFrenchHcBinarySensor(
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, prm_id)},
         )
+        self._unsub_boundary: CALLBACK_TYPE | None = None
+        self._set_schedule(schedule)
         self._update_attrs()
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
-        self.async_on_remove(
-            async_track_time_change(self.hass, self._async_update_state, second=0)
-        )
+        self._schedule_next_boundary()
+        self.async_on_remove(self._cancel_boundary)
+
+    @callback
+    def _cancel_boundary(self) -> None:
+        """Cancel the pending HC boundary update, if any."""
+        if self._unsub_boundary is not None:
+            self._unsub_boundary()
+            self._unsub_boundary = None
+
+    @callback
+    def _schedule_next_boundary(self) -> None:
+        """Schedule a state update at the next start or end of an HC range."""
+        self._cancel_boundary()
+        if (next_boundary := self._next_boundary()) is not None:
+            self._unsub_boundary = async_track_point_in_time(
+                self.hass, self._async_boundary_reached, next_boundary
+            )
 
-    async def _async_update_state(self, now: datetime | None = None) -> None:
-        """Update state based on current time."""
+    @callback
+    def _async_boundary_reached(self, now: datetime) -> None:
+        """Flip the state at an HC boundary, then wait for the next one."""
+        self._unsub_boundary = None
         self._update_attrs()
         self.async_write_ha_state()
+        self._schedule_next_boundary()
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Recompute derived attributes when coordinator data changes."""
+        self._refresh_schedule()
         self._update_attrs()
+        self._schedule_next_boundary()
         super()._handle_coordinator_update()
 
+    def _next_boundary(self) -> datetime | None:
+        """
+        Return the next local time at which the HC state can change.
+
+        L'état ne bascule qu'au début d'une plage et à la minute qui suit sa fin
+        (bornes inclusives) : inutile de réécrire l'état chaque minute.
+        """
+        if not self._hc_ranges_minutes:
+            return None
+        boundaries = sorted(
+            {
+                minute % MINUTES_PER_DAY
+                for start, end in self._hc_ranges_minutes
+                for minute in (start, end + 1)
+            }
+        )
+        now = dt_util.now()
+        current = now.hour * 60 + now.minute
+        day = now.date()
+        minute = next((m for m in boundaries if m > current), None)
+        if minute is None:
+            minute = boundaries[0]
+            day += timedelta(days=1)
+        return dt_util.start_of_local_day(day) + timedelta(minutes=minute)
+
     def _update_attrs(self) -> None:
         """Refresh the cached attribute values from schedule and current time."""
         is_on = self._compute_is_on()
         self._attr_is_on = is_on
         self._attr_icon = "mdi:clock-check" if is_on else "mdi:clock-outline"
-        self._attr_extra_state_attributes = self._compute_attributes()
 
-    def _resolve_hc_schedule(self) -> dict[str, Any]:
+    def _refresh_schedule(self) -> None:
         """
-        Return the best available HC schedule from coordinator data.
+        Resolve the HC schedule from coordinator data and cache it.
 
-        Returns a dict with keys: ranges, total_hours, range_count, source, type.
-        'source' is 'contract', 'calendar', 'linky' or 'none'.
+        Le planning ne dépend que des données du coordinator : il est résolu une
+        fois par rafraîchissement, et les plages sont gardées en minutes depuis
+        minuit : l'état et la prochaine bascule (début ou fin de plage, où une
+        mise à jour est programmée) se calculent par comparaisons d'entiers.
         """
         data = self.coordinator.data or {}
         tempo_color = get_tempo_color_for_prm(data, self._prm_id)
-        return resolve_hc_schedule(data, self._prm_id, tempo_color)
+        self._set_schedule(resolve_hc_schedule(data, self._prm_id, tempo_color))
+
+    def _set_schedule(self, schedule: dict[str, Any]) -> None:
+        """Store a resolved HC schedule, its ranges in minutes and attributes."""
+        self._schedule = schedule
+        self._hc_ranges_minutes: list[tuple[int, int]] = [
+            (r["start_minutes"], r["end_minutes"]) for r in schedule["ranges"]
+        ]
+        # Les attributs ne dépendent que du planning : inutile de les
+        # reconstruire à chaque changement d'état aux bornes des plages.
+        self._attr_extra_state_attributes = self._compute_attributes()
 
     @property
     def available(self) -> bool:
@@ -131,42 +195,25 @@ class OctopusFrenchHcBinarySensor(
         return (
             self.coordinator.last_update_success
             and self.coordinator.data is not None
-            and self._resolve_hc_schedule()["range_count"] > 0
+            and self._schedule["range_count"] > 0
         )
 
     def _compute_is_on(self) -> bool:
-        """Return True if current time is within HC periods."""
-        schedule = self._resolve_hc_schedule()
-        if not schedule["ranges"]:
-            return False
-        try:
-            now = dt_util.now().time()
-        except (AttributeError, ValueError):
+        """Return True if current time is within HC periods (handles overnight)."""
+        if not self._hc_ranges_minutes:
             return False
+        now = dt_util.now()
+        current = now.hour * 60 + now.minute
         return any(
-            self._is_time_in_range(now, r["start"], r["end"])
-            for r in schedule["ranges"]
+            start <= current <= end
+            if end > start
+            else current >= start or current <= end
+            for start, end in self._hc_ranges_minutes
         )
 
-    @staticmethod
-    def _is_time_in_range(current_time: time, start_str: str, end_str: str) -> bool:
-        """Check if current_time is within [start_str, end_str] (handles overnight)."""
-        try:
-            sh, sm = start_str.split(":")[:2]
-            eh, em = end_str.split(":")[:2]
-            start_min = int(sh) * 60 + int(sm)
-            end_min = int(eh) * 60 + int(em)
-            cur_min = current_time.hour * 60 + current_time.minute
-        except (ValueError, IndexError):
-            return False
-
-        if end_min <= start_min:
-            return cur_min >= start_min or cur_min <= end_min
-        return start_min <= cur_min <= end_min
-
     def _compute_attributes(self) -> dict[str, Any]:
         """Return HC schedule information."""
-        schedule = self._resolve_hc_schedule()
+        schedule = self._schedule
         ranges = schedule["ranges"]
 
         attributes: dict[str, Any] = {
@@ -1,5 +1,6 @@
 """Config flow for OEFR Energy integration."""
 
+import asyncio
 import logging
 from typing import Any
 
@@ -23,6 +24,18 @@ from .octopus_french import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Le client réessaie jusqu'à 3 fois avec 30 s par tentative ; le formulaire ne
+# doit pas rester bloqué aussi longtemps sur un réseau figé.
+FLOW_API_TIMEOUT = 45
+
+STEP_USER_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_EMAIL): str,
+        vol.Required(CONF_PASSWORD): str,
+    }
+)
+STEP_REAUTH_DATA_SCHEMA = vol.Schema({vol.Required(CONF_PASSWORD): str})
+
 
 class OctopusFrenchConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for OEFR Energy."""
@@ -44,22 +57,38 @@ class OctopusFrenchConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            self.email = user_input[CONF_EMAIL]
-            self.password = user_input[CONF_PASSWORD]
-            self.api_client = OctopusFrenchApiClient(
-                self.email, self.password, async_get_clientsession(self.hass)
-            )
+            credentials = (user_input[CONF_EMAIL], user_input[CONF_PASSWORD])
+            # Resoumission avec les mêmes identifiants (après une erreur) : on
+            # garde le client, son jeton encore valide évite un nouveau login.
+            if self.api_client is None or credentials != (self.email, self.password):
+                self.email, self.password = credentials
+                self.api_client = OctopusFrenchApiClient(
+                    self.email, self.password, async_get_clientsession(self.hass)
+                )
 
             try:
-                auth_success = await self.api_client.authenticate()
+                async with asyncio.timeout(FLOW_API_TIMEOUT):
+                    auth_success = await self.api_client.authenticate()
 
                 if not auth_success:
                     errors["base"] = "invalid_auth"
                 else:
-                    self.accounts = await self.api_client.get_accounts()
-
-                    if not self.accounts:
+                    async with asyncio.timeout(FLOW_API_TIMEOUT):
+                        accounts = await self.api_client.get_accounts()
+
+                    # Écarte d'emblée les comptes déjà configurés : inutile de
+                    # proposer un choix qui finirait en already_configured.
+                    configured = self._async_current_ids()
+                    self.accounts = [
+                        account
+                        for account in accounts
+                        if account["number"] not in configured
+                    ]
+
+                    if not accounts:
                         errors["base"] = "no_accounts"
+                    elif not self.accounts:
+                        return self.async_abort(reason="already_configured")
                     elif len(self.accounts) == 1:
                         return await self._async_create_account_entry(
                             self.accounts[0]["number"]
@@ -79,12 +108,7 @@ class OctopusFrenchConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_EMAIL): str,
-                    vol.Required(CONF_PASSWORD): str,
-                }
-            ),
+            data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
         )
 
@@ -115,15 +139,14 @@ class OctopusFrenchConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 user_input[CONF_ACCOUNT_NUMBER]
             )
 
-        account_list = {
-            account["number"]: f"{account['number']}" for account in self.accounts
-        }
+        # Le libellé est le numéro lui-même : une simple liste suffit à vol.In.
+        account_numbers = [account["number"] for account in self.accounts]
 
         return self.async_show_form(
             step_id="account",
             data_schema=vol.Schema(
                 {
-                    vol.Required(CONF_ACCOUNT_NUMBER): vol.In(account_list),
+                    vol.Required(CONF_ACCOUNT_NUMBER): vol.In(account_numbers),
                 }
             ),
             errors=errors,
@@ -147,7 +170,8 @@ class OctopusFrenchConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             )
 
             try:
-                auth_success = await api_client.authenticate()
+                async with asyncio.timeout(FLOW_API_TIMEOUT):
+                    auth_success = await api_client.authenticate()
                 if not auth_success:
                     errors["base"] = "invalid_auth"
                 else:
@@ -170,6 +194,6 @@ class OctopusFrenchConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="reauth_confirm",
-            data_schema=vol.Schema({vol.Required(CONF_PASSWORD): str}),
+            data_schema=STEP_REAUTH_DATA_SCHEMA,
             errors=errors,
         )
@@ -9,6 +9,10 @@ CONF_REFRESH_TOKEN_EXPIRY = "refresh_token_expiry"
 LEDGER_TYPE_ELECTRICITY = "FRA_ELECTRICITY_LEDGER"
 LEDGER_TYPE_GAS = "FRA_GAS_LEDGER"
 LEDGER_TYPE_POT = "POT_LEDGER"
+# Ledgers rattachés à un compteur (PRM/PCE entre parenthèses dans leur nom).
+METER_LEDGER_TYPES: frozenset[str] = frozenset(
+    {LEDGER_TYPE_ELECTRICITY, LEDGER_TYPE_GAS}
+)
 
 DEFAULT_SCAN_INTERVAL = 60
 # Kraken applique un rate-limit dynamique (KT-CT-1199) : un polling à la minute
@@ -37,6 +41,9 @@ TEMPO_TEMPORAL_CLASS_CODES: frozenset[str] = frozenset(
     {"HPP", "HCP", "HPHI", "HCHI", "HPE", "HCE"}
 )
 
+# Classes temporelles des index Base / HP-HC (hors Tempo).
+STANDARD_TEMPORAL_CLASS_CODES: frozenset[str] = frozenset({"HP", "HC", "BASE"})
+
 TEMPO_CALENDAR_COLORS: frozenset[str] = frozenset({"ETE", "HIVER", "ROUGE"})
 
 # Clé de sensor energy_* → label de consommation renvoyé par l'API.
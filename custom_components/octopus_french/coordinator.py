@@ -40,6 +40,10 @@ class OctopusFrenchDataUpdateCoordinator(DataUpdateCoordinator):
             name="Octopus French Energy",
             update_interval=timedelta(minutes=DEFAULT_SCAN_INTERVAL),
             config_entry=config_entry,
+            # Les relevés sont journaliers : la plupart des ticks horaires
+            # renvoient les mêmes données, inutile de réécrire chaque état. Les
+            # totaux mensuels gaz programment eux-mêmes leur remise à zéro.
+            always_update=False,
         )
         self.api_client = api_client
         self.account_number = account_number
@@ -106,18 +110,19 @@ class OctopusFrenchDataUpdateCoordinator(DataUpdateCoordinator):
 
         async def fetch_electricity_for_prm(prm_id: str) -> tuple[str, list, Any]:
             try:
-                readings = await self.api_client.get_energy_readings(
-                    property_id_by_prm.get(prm_id, account_id),
-                    electricity_start,
-                    date_end,
-                    prm_id,
-                    utility_type="electricity",
-                    reading_frequency="DAY_INTERVAL",
-                    reading_quality="ACTUAL",
-                    first=100,
-                )
-                index = await self.api_client.get_electricity_index(
-                    account_number, prm_id
+                # Relevés et index sont deux requêtes indépendantes.
+                readings, index = await asyncio.gather(
+                    self.api_client.get_energy_readings(
+                        property_id_by_prm.get(prm_id, account_id),
+                        electricity_start,
+                        date_end,
+                        prm_id,
+                        utility_type="electricity",
+                        reading_frequency="DAY_INTERVAL",
+                        reading_quality="ACTUAL",
+                        first=100,
+                    ),
+                    self.api_client.get_electricity_index(account_number, prm_id),
                 )
             except OctopusConnectionError as err:
                 _LOGGER.warning(
@@ -2,7 +2,9 @@
 
 import asyncio
 import logging
+import random
 import re
+import time
 from collections.abc import Callable
 from contextlib import suppress
 from datetime import UTC, datetime, timedelta
@@ -11,6 +13,14 @@ from typing import Any, ClassVar
 import aiohttp
 import jwt
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
+from yarl import URL
+
+from .const import (
+    METER_LEDGER_TYPES,
+    STANDARD_TEMPORAL_CLASS_CODES,
+    TEMPO_TEMPORAL_CLASS_CODES,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,15 +38,29 @@ class OctopusRateLimitError(OctopusConnectionError):
 
 
 GRAPHQL_ENDPOINT = "https://api.oefr-kraken.energy/v1/graphql/"
+# URL et en-têtes communs construits une fois plutôt qu'à chaque requête.
+GRAPHQL_URL = URL(GRAPHQL_ENDPOINT)
+BASE_HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
 
 TOKEN_EXPIRY_BUFFER = 60
 MAX_RETRY_ATTEMPTS = 3
+# Construit une fois : un connect bloqué échoue vite sans attendre les 30 s.
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=10)
 RETRY_DELAY = 1
+# Plafond d'attente entre deux essais, Retry-After compris, et jitter ajouté pour
+# désynchroniser les requêtes lancées ensemble par le coordinator.
+MAX_RETRY_DELAY = 10
+RETRY_JITTER = 0.5
 # Garde-fou : un endCursor qui ne progresse pas ne doit pas bloquer l'event loop.
 MAX_PAGINATION_PAGES = 50
 RATE_LIMIT_ERROR_CODE = "KT-CT-1199"
 # Kraken refresh tokens last 7 days; used when the API omits refreshExpiresIn.
 DEFAULT_REFRESH_EXPIRY = 7 * 24 * 3600
+# Messages GraphQL signalant un jeton expiré ou refusé : une passe de regex par
+# message au lieu d'un lower() puis d'un test par mot-clé.
+AUTH_ERROR_PATTERN = re.compile(r"authentication|unauthorized|token|expired", re.I)
+# PRM/PCE entre parenthèses dans le nom d'un ledger, ex. « Électricité (123) ».
+LEDGER_METER_ID_PATTERN = re.compile(r"\((\d+)\)")
 
 MUTATION_LOGIN = """
 mutation obtainKrakenToken($input: ObtainJSONWebTokenInput!) {
@@ -362,9 +386,20 @@ query getGasReadings($accountNumber: String!, $pceRef: String!, $periodStartAt:
 """
 
 
+def _retry_delay(attempt: int, retry_after: str | None = None) -> float:
+    """Return the wait before the next attempt: Retry-After, else backoff + jitter."""
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), MAX_RETRY_DELAY)
+    return min(RETRY_DELAY * 2**attempt, MAX_RETRY_DELAY) + random.uniform(
+        0, RETRY_JITTER
+    )
+
+
 class TokenManager:
     """Robust token management with automatic refresh."""
 
+    __slots__ = ("_expiry", "_refresh_expiry", "_refresh_token", "_token")
+
     def __init__(self) -> None:
         """Initialize the token manager."""
         self._token: str | None = None
@@ -402,7 +437,7 @@ class TokenManager:
         if not self._token or not self._expiry:
             return False
 
-        now = datetime.now(UTC).timestamp()
+        now = time.time()
 
         return now < (self._expiry - TOKEN_EXPIRY_BUFFER)
 
@@ -412,7 +447,7 @@ class TokenManager:
         if not self._refresh_token or not self._refresh_expiry:
             return False
 
-        now = datetime.now(UTC).timestamp()
+        now = time.time()
 
         return now < (self._refresh_expiry - TOKEN_EXPIRY_BUFFER)
 
@@ -421,7 +456,7 @@ class TokenManager:
         """Get seconds until token expiry."""
         if not self._expiry:
             return 0
-        return max(0, self._expiry - datetime.now(UTC).timestamp())
+        return max(0, self._expiry - time.time())
 
     def set_token(
         self,
@@ -432,15 +467,15 @@ class TokenManager:
         """Set a new token, its optional refresh token, and decode the expiries."""
         self._token = token
 
-        self._expiry = datetime.now(UTC).timestamp() + 3600
-        with suppress(Exception):
+        self._expiry = time.time() + 3600
+        with suppress(jwt.PyJWTError, TypeError, ValueError):
             decoded = jwt.decode(token, options={"verify_signature": False})
             if exp := decoded.get("exp"):
                 self._expiry = float(exp)
 
         if refresh_token:
             self._refresh_token = refresh_token
-            self._refresh_expiry = datetime.now(UTC).timestamp() + float(
+            self._refresh_expiry = time.time() + float(
                 refresh_expires_in or DEFAULT_REFRESH_EXPIRY
             )
 
@@ -478,23 +513,20 @@ class OctopusFrenchApiClient:
     ) -> dict[str, Any]:
         """Execute GraphQL query with retry logic."""
         payload = {"query": query, "variables": variables or {}}
-        request_headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
-        if headers:
-            request_headers.update(headers)
+        request_headers = BASE_HEADERS | headers if headers else BASE_HEADERS
 
         for attempt in range(MAX_RETRY_ATTEMPTS):
             try:
                 async with self._session.post(
-                    GRAPHQL_ENDPOINT,
+                    GRAPHQL_URL,
                     json=payload,
                     headers=request_headers,
-                    timeout=aiohttp.ClientTimeout(total=30),
+                    timeout=REQUEST_TIMEOUT,
                 ) as response:
                     if response.status == 200:
-                        return await response.json()
+                        # orjson (fourni par HA) : les réponses de relevés
+                        # pèsent plusieurs dizaines de Ko.
+                        return await response.json(loads=json_loads)
                     body = (await response.text())[:500]
                     _LOGGER.warning(
                         "GraphQL endpoint returned HTTP %s (attempt %s/%s): %s",
@@ -503,16 +535,22 @@ class OctopusFrenchApiClient:
                         MAX_RETRY_ATTEMPTS,
                         body,
                     )
+                    # Jeton refusé : à l'appelant de se réauthentifier, un
+                    # nouvel essai avec le même jeton échouerait pareil.
+                    if response.status == 401:
+                        raise OctopusAuthError("GraphQL endpoint returned HTTP 401")
                     # Les 4xx (hors 429) ne se résoudront pas en réessayant.
                     if 400 <= response.status < 500 and response.status != 429:
                         raise OctopusConnectionError(
                             f"GraphQL endpoint returned HTTP {response.status}"
                         )
                     if attempt < MAX_RETRY_ATTEMPTS - 1:
-                        await asyncio.sleep(RETRY_DELAY * (attempt + 1))
+                        await asyncio.sleep(
+                            _retry_delay(attempt, response.headers.get("Retry-After"))
+                        )
             except (aiohttp.ClientError, TimeoutError):
                 if attempt < MAX_RETRY_ATTEMPTS - 1:
-                    await asyncio.sleep(RETRY_DELAY * (attempt + 1))
+                    await asyncio.sleep(_retry_delay(attempt))
                     continue
         raise OctopusConnectionError("Unable to reach GraphQL endpoint after retries")
 
@@ -537,10 +575,14 @@ class OctopusFrenchApiClient:
 
     async def _obtain_token(self, token_input: dict[str, Any]) -> dict[str, Any]:
         """Run the obtainKrakenToken mutation, surfacing rate limits explicitly."""
-        result = await self._async_execute(
-            query=MUTATION_LOGIN,
-            variables={"input": token_input},
-        )
+        try:
+            result = await self._async_execute(
+                query=MUTATION_LOGIN,
+                variables={"input": token_input},
+            )
+        except OctopusAuthError as err:
+            # Même forme qu'un refus GraphQL : pas de jeton, message d'erreur.
+            return {"errors": [{"message": str(err)}]}
 
         if not result:
             raise OctopusConnectionError("Failed to reach authentication server")
@@ -605,7 +647,11 @@ class OctopusFrenchApiClient:
         # Refreshing is preferred over a full login: repeated email/password logins
         # trip Kraken's dynamic rate limit (KT-CT-1199), which then rejects every
         # further login attempt for a while.
+        if self.token_manager.is_valid:
+            return True
+
         async with self._auth_lock:
+            # Re-check: another caller may have renewed the token while we waited
             if self.token_manager.is_valid:
                 return True
 
@@ -628,11 +674,26 @@ class OctopusFrenchApiClient:
             raise OctopusAuthError("Authentication failed: invalid credentials")
 
         headers = {"Authorization": f"JWT {self.token_manager.token}"}
-        result = await self._async_execute(
-            query=query,
-            variables=variables,
-            headers=headers,
-        )
+        try:
+            result = await self._async_execute(
+                query=query,
+                variables=variables,
+                headers=headers,
+            )
+        except OctopusAuthError:
+            # HTTP 401 : on renouvelle le jeton sans parser ni scanner de corps.
+            if retry_count >= 1:
+                # Le jeton vient d'être renouvelé avec succès : les identifiants
+                # sont bons, ce second refus est donc transitoire.
+                raise OctopusConnectionError(
+                    "GraphQL endpoint returned HTTP 401 with a renewed token"
+                ) from None
+            self.token_manager.clear()
+            return await self.execute_with_auth(
+                query=query,
+                variables=variables,
+                retry_count=retry_count + 1,
+            )
 
         if "errors" in result:
             error_messages = self._extract_error_messages(result)
@@ -645,11 +706,8 @@ class OctopusFrenchApiClient:
                     + "; ".join(error_messages)
                 )
 
-            auth_keywords = {"authentication", "unauthorized", "token", "expired"}
             is_auth_error = any(
-                keyword in msg.lower()
-                for msg in error_messages
-                for keyword in auth_keywords
+                AUTH_ERROR_PATTERN.search(msg) for msg in error_messages
             )
 
             if is_auth_error and retry_count < 1:
@@ -689,9 +747,10 @@ class OctopusFrenchApiClient:
         properties = account.get("properties", [])
         account_id = properties[0].get("id") if properties else None
 
-        ledgers = self._extract_ledgers(account)
+        # Un seul parcours des propriétés pour les compteurs et les PRM actifs
+        supply_points, active_prms = self._parse_properties(properties)
 
-        supply_points = self._extract_supply_points(properties)
+        ledgers = self._extract_ledgers(account, active_prms)
 
         agreements = self._extract_agreements(account)
 
@@ -703,27 +762,11 @@ class OctopusFrenchApiClient:
             "agreements": agreements,
         }
 
-    def _extract_ledgers(self, account: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    def _extract_ledgers(
+        self, account: dict[str, Any], active_prms: set[str]
+    ) -> dict[str, dict[str, Any]]:
         """Extract ledgers from account data, filtering out terminated meters."""
         ledgers = {}
-        active_prms = set()
-        properties = account.get("properties", [])
-
-        for prop in properties:
-            if not isinstance(prop, dict):
-                continue
-
-            edges = (prop.get("supplyPoints") or {}).get("edges", [])
-            for edge in edges:
-                node = edge.get("node") or {}
-                meter_point = node.get("meterPoint") or {}
-
-                if meter_point.get("distributorStatus") == "RESIL":
-                    continue
-
-                prm = node.get("externalIdentifier")
-                if prm:
-                    active_prms.add(prm)
 
         ledger_list = account.get("ledgers", [])
         if ledger_list:
@@ -737,8 +780,8 @@ class OctopusFrenchApiClient:
                 if not ledger_type:
                     continue
 
-                if ledger_type in ["FRA_ELECTRICITY_LEDGER", "FRA_GAS_LEDGER"]:
-                    match = re.search(r"\((\d+)\)", ledger_name)
+                if ledger_type in METER_LEDGER_TYPES:
+                    match = LEDGER_METER_ID_PATTERN.search(ledger_name)
                     if match:
                         ledger_prm = match.group(1)
 
@@ -774,17 +817,21 @@ class OctopusFrenchApiClient:
 
         return ledgers
 
-    def _extract_supply_points(
-        self, properties: Any
-    ) -> dict[str, list[dict[str, Any]]]:
-        """Extract supply points from properties."""
-        supply_points = {"electricity": [], "gas": []}
-
-        if not isinstance(properties, list):
-            return supply_points
+    @staticmethod
+    def _parse_properties(
+        properties: Any,
+    ) -> tuple[dict[str, list[dict[str, Any]]], set[str]]:
+        """Return supply points and the PRMs of non-terminated meters in one pass."""
+        supply_points: dict[str, list[dict[str, Any]]] = {
+            "electricity": [],
+            "gas": [],
+        }
+        active_prms: set[str] = set()
 
-        for prop in properties:
-            if not isinstance(prop, dict):
+        # Schéma GraphQL : `properties` est une liste (ou null), chaque élément
+        # un objet (ou null) ; pas besoin de vérifier les types un par un.
+        for prop in properties or ():
+            if not prop:
                 continue
 
             edges = (prop.get("supplyPoints") or {}).get("edges", [])
@@ -792,6 +839,11 @@ class OctopusFrenchApiClient:
                 node = edge.get("node") or {}
                 meter_point = node.get("meterPoint") or {}
 
+                if meter_point.get("distributorStatus") != "RESIL" and (
+                    prm := node.get("externalIdentifier")
+                ):
+                    active_prms.add(prm)
+
                 meter_point["prm"] = node.get("externalIdentifier")
                 meter_point["supply_point_id"] = node.get("id")
                 meter_point["property_id"] = prop.get("id")
@@ -813,7 +865,7 @@ class OctopusFrenchApiClient:
                     meter_point.setdefault("cutDate", None)
                     supply_points["gas"].append(meter_point)
 
-        return supply_points
+        return supply_points, active_prms
 
     def _extract_agreements(self, account: dict[str, Any]) -> list[dict[str, Any]]:
         """Extract agreements with tariffs from account data."""
@@ -1096,19 +1148,18 @@ class OctopusFrenchApiClient:
             )
             gas_reading = (result.get("data") or {}).get("gasReading") or {}
 
-            for edge in gas_reading.get("edges", []):
-                node = edge["node"]
-                all_nodes.append(
-                    {
-                        "value": node.get("consumption"),
-                        "startAt": node.get("periodStartAt"),
-                        "endAt": node.get("periodEndAt"),
-                        "indexStartValue": node.get("indexStartValue"),
-                        "indexEndValue": node.get("indexEndValue"),
-                        "statusProcessed": node.get("statusProcessed"),
-                        "energyQualification": node.get("energyQualification"),
-                    }
-                )
+            all_nodes.extend(
+                {
+                    "value": node.get("consumption"),
+                    "startAt": node.get("periodStartAt"),
+                    "endAt": node.get("periodEndAt"),
+                    "indexStartValue": node.get("indexStartValue"),
+                    "indexEndValue": node.get("indexEndValue"),
+                    "statusProcessed": node.get("statusProcessed"),
+                    "energyQualification": node.get("energyQualification"),
+                }
+                for node in (edge["node"] for edge in gas_reading.get("edges", []))
+            )
             page_info = gas_reading.get("pageInfo", {})
             if not page_info.get("hasNextPage"):
                 break
@@ -1207,7 +1258,7 @@ class OctopusFrenchApiClient:
 
             effective_code = tc_code or temp_class
 
-            if effective_code in ["HP", "HC", "BASE"]:
+            if effective_code in STANDARD_TEMPORAL_CLASS_CODES:
                 key = effective_code.lower()
                 index_data[key] = {
                     "consumption": node.get("consumption"),
@@ -1224,17 +1275,14 @@ class OctopusFrenchApiClient:
                 if effective_code == "BASE":
                     if tariff_type != "TEMPO":
                         tariff_type = "BASE"
-                elif effective_code in ["HP", "HC"] and tariff_type not in (
-                    "BASE",
-                    "TEMPO",
-                ):
+                elif tariff_type not in ("BASE", "TEMPO"):
                     tariff_type = "HPHC"
 
                 if not period_start:
                     period_start = node.get("periodStartAt")
                     period_end = node.get("periodEndAt")
 
-            elif effective_code in ("HPP", "HCP", "HPHI", "HCHI", "HPE", "HCE"):
+            elif effective_code in TEMPO_TEMPORAL_CLASS_CODES:
                 tariff_type = "TEMPO"
                 key = self._TEMPORAL_CLASS_TO_KEY.get(effective_code)
                 if key:
@@ -1,12 +1,13 @@
 """Gas sensor entity for Octopus Energy France."""
 
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any
 
 from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
-from homeassistant.core import callback
+from homeassistant.core import CALLBACK_TYPE, callback
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.event import async_track_point_in_time
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
@@ -16,6 +17,17 @@ from ..utils import get_tariff_rate_for_key
 
 _LOGGER = logging.getLogger(__name__)
 
+# Totaux du mois en cours, remis à zéro le 1er du mois
+MONTHLY_TOTAL_KEYS = frozenset({"consumption", "cost", "subscription"})
+
+
+def _next_month_start() -> datetime:
+    """Return local midnight on the first day of next month."""
+    month_start = dt_util.start_of_local_day().replace(day=1)
+    return dt_util.start_of_local_day(
+        (month_start + timedelta(days=32)).date().replace(day=1)
+    )
+
 
 class OctopusGasSensor(
     CoordinatorEntity[OctopusFrenchDataUpdateCoordinator], SensorEntity
@@ -49,8 +61,40 @@ class OctopusGasSensor(
         self._attr_entity_category = sensor_config.entity_category
 
         self._current_month: str | None = None
+        self._unsub_month_start: CALLBACK_TYPE | None = None
         self._update_attrs()
 
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        if self._sensor_config.key in MONTHLY_TOTAL_KEYS:
+            self._schedule_month_start()
+            self.async_on_remove(self._cancel_month_start)
+
+    @callback
+    def _cancel_month_start(self) -> None:
+        """Cancel the pending month start update, if any."""
+        if self._unsub_month_start is not None:
+            self._unsub_month_start()
+            self._unsub_month_start = None
+
+    @callback
+    def _schedule_month_start(self) -> None:
+        """Schedule a state update at the start of next month."""
+        # La fenêtre gaz glisse d'un jour à la fois : au 1er du mois les données
+        # du coordinator peuvent être inchangées et ne déclencher aucune mise à jour.
+        self._unsub_month_start = async_track_point_in_time(
+            self.hass, self._async_month_started, _next_month_start()
+        )
+
+    @callback
+    def _async_month_started(self, now: datetime) -> None:
+        """Reset the monthly totals, then wait for the next month."""
+        self._unsub_month_start = None
+        self._update_attrs()
+        self.async_write_ha_state()
+        self._schedule_month_start()
+
     def _get_current_month(self) -> str:
         """Get current month in YYYY-MM format."""
         return dt_util.now().strftime("%Y-%m")
@@ -145,8 +189,7 @@ class OctopusGasSensor(
 
     def _compute_last_reset(self) -> datetime | None:
         """Expose the monthly reset for the current-month total sensors."""
-        key = self._sensor_config.key
-        if key in ("consumption", "cost", "subscription"):
+        if self._sensor_config.key in MONTHLY_TOTAL_KEYS:
             return dt_util.start_of_local_day().replace(day=1)
         return None
 
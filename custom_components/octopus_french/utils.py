@@ -26,6 +26,10 @@ _TEMPO_COLOR_TO_HC_TEMPORAL_CODE = {
     "ROUGE": "HCP",
 }
 
+# Libellé offPeakLabel, ex. « HC (22H00-6H00) » : type puis plages horaires.
+_OFF_PEAK_TYPE_RE = re.compile(r"^([A-Z]+)")
+_OFF_PEAK_RANGE_RE = re.compile(r"(\d+)H(\d+)-(\d+)H(\d+)")
+
 # PRM pour lesquels le repli sur offPeakLabel a déjà été signalé, pour ne pas
 # répéter l'avertissement à chaque rafraîchissement du coordinator.
 _LINKY_FALLBACK_WARNED: set[str] = set()
@@ -44,11 +48,10 @@ def parse_off_peak_hours(off_peak_label: str | None) -> dict[str, Any]:
         return result
 
     try:
-        if type_match := re.match(r"^([A-Z]+)", off_peak_label):
+        if type_match := _OFF_PEAK_TYPE_RE.match(off_peak_label):
             result["type"] = type_match.group(1)
 
-        time_pattern = r"(\d+)H(\d+)-(\d+)H(\d+)"
-        matches = re.findall(time_pattern, off_peak_label)
+        matches = _OFF_PEAK_RANGE_RE.findall(off_peak_label)
 
         total_minutes = 0
 
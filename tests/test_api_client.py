@@ -0,0 +1,27 @@
+"""Tests du client GraphQL : transport."""
+
+from __future__ import annotations
+
+from custom_components.octopus_french.octopus_french import (
+    MAX_RETRY_DELAY,
+    RETRY_DELAY,
+    RETRY_JITTER,
+    _retry_delay,
+)
+
+
+def test_retry_delay_backs_off_with_bounded_jitter() -> None:
+    """Chaque essai double l'attente, avec un jitter borné."""
+    for attempt in range(3):
+        delay = _retry_delay(attempt)
+        base = RETRY_DELAY * 2**attempt
+        assert base <= delay <= base + RETRY_JITTER
+
+
+def test_retry_delay_honours_capped_retry_after() -> None:
+    """Un Retry-After numérique prime, plafonné à MAX_RETRY_DELAY."""
+    assert _retry_delay(0, "3") == 3
+    assert _retry_delay(0, "3600") == MAX_RETRY_DELAY
+    assert (
+        _retry_delay(0, "Wed, 21 Oct 2026 07:28:00 GMT") <= RETRY_DELAY + RETRY_JITTER
+    )
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
@@ -14,11 +15,15 @@ from custom_components.octopus_french import _async_authenticate
 from custom_components.octopus_french.octopus_french import (
     DEFAULT_REFRESH_EXPIRY,
     RATE_LIMIT_ERROR_CODE,
+    OctopusAuthError,
+    OctopusConnectionError,
     OctopusFrenchApiClient,
     OctopusRateLimitError,
     TokenManager,
 )
 
+VIEWER_RESPONSE: dict[str, Any] = {"data": {"viewer": {"id": "1"}}}
+
 RATE_LIMIT_RESPONSE = {
     "data": {"obtainKrakenToken": None},
     "errors": [
@@ -194,6 +199,17 @@ async def test_authenticate_skips_network_when_token_is_valid(
     client._async_execute.assert_not_called()
 
 
+async def test_authenticate_skips_lock_when_token_valid(
+    client: OctopusFrenchApiClient,
+) -> None:
+    """A valid access token does not wait on the authentication lock."""
+    client.token_manager.set_token(_make_jwt())
+
+    # Sans le raccourci, authenticate() attendrait le verrou indéfiniment.
+    async with client._auth_lock, asyncio.timeout(1):
+        assert await client.authenticate()
+
+
 async def test_authenticate_refreshes_without_sending_credentials(
     client: OctopusFrenchApiClient,
 ) -> None:
@@ -276,3 +292,32 @@ async def test_setup_retries_later_when_rate_limited(
 
     with pytest.raises(ConfigEntryNotReady):
         await _async_authenticate(client)
+
+
+async def test_http_401_renews_token_and_retries(
+    client: OctopusFrenchApiClient,
+) -> None:
+    """An HTTP 401 renews the token and replays the query once."""
+    client.token_manager.set_token(_make_jwt())
+    client.authenticate = AsyncMock(return_value=True)
+    client._async_execute.side_effect = [OctopusAuthError("HTTP 401"), VIEWER_RESPONSE]
+
+    result = await client.execute_with_auth(query="query { viewer { id } }")
+
+    assert result == VIEWER_RESPONSE
+    assert client._async_execute.await_count == 2
+    client.authenticate.assert_awaited_once()
+
+
+async def test_second_http_401_is_transient(
+    client: OctopusFrenchApiClient,
+) -> None:
+    """A 401 right after a successful renewal is not a credentials problem."""
+    client.token_manager.set_token(_make_jwt())
+    client.authenticate = AsyncMock(return_value=True)
+    client._async_execute.side_effect = OctopusAuthError("HTTP 401")
+
+    with pytest.raises(OctopusConnectionError):
+        await client.execute_with_auth(query="query { viewer { id } }")
+
+    assert client._async_execute.await_count == 2
@@ -1,5 +1,6 @@
 """Tests for the Octopus French Energy config flow."""
 
+import asyncio
 from contextlib import AbstractContextManager
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -33,6 +34,7 @@ def flow() -> OctopusFrenchConfigFlow:
     instance.hass = MagicMock()
     instance.async_set_unique_id = AsyncMock()
     instance._abort_if_unique_id_configured = MagicMock()
+    instance._async_current_ids = MagicMock(return_value=set())
     return instance
 
 
@@ -84,6 +86,28 @@ async def test_multiple_accounts_show_account_step(
     assert result["step_id"] == "account"
 
 
+async def test_configured_accounts_are_not_offered(
+    flow: OctopusFrenchConfigFlow,
+) -> None:
+    """Already configured accounts are skipped before the selection step."""
+    flow._async_current_ids.return_value = {"A-1"}
+    with _patch_client(accounts=[{"number": "A-1"}, {"number": "A-2"}]):
+        result = await flow.async_step_user(_USER_INPUT)
+
+    assert result["type"] == "create_entry"
+    assert result["data"][CONF_ACCOUNT_NUMBER] == "A-2"
+
+
+async def test_all_accounts_configured_aborts(flow: OctopusFrenchConfigFlow) -> None:
+    """A login whose accounts are all configured aborts without a form."""
+    flow._async_current_ids.return_value = {"A-1"}
+    with _patch_client(accounts=[{"number": "A-1"}]):
+        result = await flow.async_step_user(_USER_INPUT)
+
+    assert result["type"] == "abort"
+    assert result["reason"] == "already_configured"
+
+
 async def test_account_step_creates_entry(flow: OctopusFrenchConfigFlow) -> None:
     """Selecting an account in the account step creates the entry."""
     flow.email = _USER_INPUT["email"]
@@ -246,3 +270,36 @@ async def test_reauth_confirm_purges_persisted_refresh_token(
     assert new_data["password"] == "new-pw"
     assert "refresh_token" not in new_data
     assert "refresh_token_expiry" not in new_data
+
+
+async def test_resubmit_same_credentials_reuses_client(
+    flow: OctopusFrenchConfigFlow,
+) -> None:
+    """Resubmitting unchanged credentials keeps the already authenticated client."""
+    with _patch_client(accounts=[]) as client_cls:
+        await flow.async_step_user(_USER_INPUT)
+        await flow.async_step_user(_USER_INPUT)
+        await flow.async_step_user({**_USER_INPUT, "password": "other"})
+
+    assert client_cls.call_count == 2
+
+
+async def test_timeout_surfaces_cannot_connect(flow: OctopusFrenchConfigFlow) -> None:
+    """A stalled API call is cut short and reported as cannot_connect."""
+
+    async def _hang() -> bool:
+        await asyncio.Event().wait()
+        return True
+
+    with (
+        _patch_client() as client_cls,
+        patch(
+            "custom_components.octopus_french.config_flow.FLOW_API_TIMEOUT",
+            0.01,
+        ),
+    ):
+        client_cls.return_value.authenticate.side_effect = _hang
+        async with asyncio.timeout(1):
+            result = await flow.async_step_user(_USER_INPUT)
+
+    assert result["errors"] == {"base": "cannot_connect"}
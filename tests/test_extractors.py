@@ -37,10 +37,12 @@ def test_extract_ledgers_with_null_nested_objects(
         "creditStorage": None,
     }
 
-    assert client._extract_ledgers(account) == {}
+    _, active_prms = client._parse_properties(account["properties"])
 
+    assert client._extract_ledgers(account, active_prms) == {}
 
-def test_extract_supply_points_with_null_nested_objects(
+
+def test_parse_properties_with_null_nested_objects(
     client: OctopusFrenchApiClient,
 ) -> None:
     """Null supplyPoints, node and meterPoint yield no meters rather than a crash."""
@@ -50,13 +52,13 @@ def test_extract_supply_points_with_null_nested_objects(
         {"supplyPoints": {"edges": [{"node": {"meterPoint": None}}]}},
     ]
 
-    assert client._extract_supply_points(properties) == {
-        "electricity": [],
-        "gas": [],
-    }
+    assert client._parse_properties(properties) == (
+        {"electricity": [], "gas": []},
+        set(),
+    )
 
 
-def test_extract_supply_points_with_null_provider_calendar(
+def test_parse_properties_with_null_provider_calendar(
     client: OctopusFrenchApiClient,
 ) -> None:
     """A null providerCalendar leaves the meter without temporal classes."""
@@ -78,13 +80,13 @@ def test_extract_supply_points_with_null_provider_calendar(
         }
     ]
 
-    [meter] = client._extract_supply_points(properties)["electricity"]
+    [meter] = client._parse_properties(properties)[0]["electricity"]
 
     assert meter["prm"] == "12345"
     assert meter["provider_temporal_classes"] == []
 
 
-def test_extract_supply_points_keeps_parent_property_id(
+def test_parse_properties_keeps_parent_property_id(
     client: OctopusFrenchApiClient,
 ) -> None:
     """Chaque compteur retient l'id de SA property (routage des relevés, issue #56)."""
@@ -117,7 +119,7 @@ def test_extract_supply_points_keeps_parent_property_id(
         },
     ]
 
-    electricity = client._extract_supply_points(properties)["electricity"]
+    electricity = client._parse_properties(properties)[0]["electricity"]
     property_by_prm = {m["prm"]: m["property_id"] for m in electricity}
 
     assert property_by_prm == {"PRM_A": "PROP-1", "PRM_B": "PROP-2"}
@@ -191,3 +193,35 @@ def test_detect_tariff_type_with_null_metadata() -> None:
     }
 
     assert _detect_tariff_type_for_meter(data, "12345") == "UNKNOWN"
+
+
+def test_parse_properties_returns_only_active_prms(
+    client: OctopusFrenchApiClient,
+) -> None:
+    """Terminated (RESIL) meters are listed but their PRM is not active."""
+    properties = [
+        {
+            "id": "1",
+            "supplyPoints": {
+                "edges": [
+                    {
+                        "node": {
+                            "externalIdentifier": "111",
+                            "meterPoint": {"distributorStatus": "SERVC"},
+                        }
+                    },
+                    {
+                        "node": {
+                            "externalIdentifier": "222",
+                            "meterPoint": {"distributorStatus": "RESIL"},
+                        }
+                    },
+                ]
+            },
+        }
+    ]
+
+    supply_points, active_prms = client._parse_properties(properties)
+
+    assert [meter["prm"] for meter in supply_points["electricity"]] == ["111", "222"]
+    assert active_prms == {"111"}
@@ -0,0 +1,42 @@
+"""Tests du capteur gaz : remise à zéro mensuelle."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.octopus_french.sensors.gas import _next_month_start
+
+
+def _local_midnight(day: date) -> datetime:
+    """Minuit heure locale HA (le fuseau de test n'est pas UTC)."""
+    return dt_util.start_of_local_day(day)
+
+
+def test_next_month_start_within_year() -> None:
+    """Le réveil tombe à minuit le 1er du mois suivant."""
+    with patch(
+        "custom_components.octopus_french.sensors.gas.dt_util.now",
+        return_value=_local_midnight(date(2026, 1, 31)) + timedelta(hours=23),
+    ):
+        assert _next_month_start() == _local_midnight(date(2026, 2, 1))
+
+
+def test_next_month_start_rolls_over_year() -> None:
+    """En décembre, le réveil passe à janvier de l'année suivante."""
+    with patch(
+        "custom_components.octopus_french.sensors.gas.dt_util.now",
+        return_value=_local_midnight(date(2026, 12, 15)),
+    ):
+        assert _next_month_start() == _local_midnight(date(2027, 1, 1))
+
+
+def test_next_month_start_from_short_month() -> None:
+    """Depuis février, le réveil tombe le 1er mars et non quelques jours après."""
+    with patch(
+        "custom_components.octopus_french.sensors.gas.dt_util.now",
+        return_value=_local_midnight(date(2026, 2, 1)),
+    ):
+        assert _next_month_start() == _local_midnight(date(2026, 3, 1))
@@ -2,6 +2,13 @@
 
 from __future__ import annotations
 
+from contextlib import AbstractContextManager
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.octopus_french.binary_sensor import OctopusFrenchHcBinarySensor
 from custom_components.octopus_french.utils import (
     find_calendar_hc_ranges,
     find_contract_hc_slots,
@@ -299,3 +306,62 @@ class TestResolveHcSchedule:
         schedule = resolve_hc_schedule(data, "PRM1", tempo_color="ETE")
         assert schedule["source"] == "none"
         assert schedule["range_count"] == 0
+
+
+def _local(day: date, hour: int, minute: int) -> datetime:
+    """Heure locale HA (le fuseau de test n'est pas UTC)."""
+    return dt_util.start_of_local_day(day) + timedelta(hours=hour, minutes=minute)
+
+
+class TestHcBinarySensorIsOn:
+    """État du binaire HC calculé sur les plages en minutes mises en cache."""
+
+    @staticmethod
+    def _sensor(ranges: list[tuple[int, int]]) -> OctopusFrenchHcBinarySensor:
+        sensor = OctopusFrenchHcBinarySensor.__new__(OctopusFrenchHcBinarySensor)
+        sensor._hc_ranges_minutes = ranges
+        return sensor
+
+    @staticmethod
+    def _at(hour: int, minute: int) -> AbstractContextManager:
+        return patch(
+            "custom_components.octopus_french.binary_sensor.dt_util.now",
+            return_value=_local(date(2026, 1, 15), hour, minute),
+        )
+
+    def test_daytime_range(self):
+        """Une plage de journée est inclusive à ses deux bornes."""
+        sensor = self._sensor([(14 * 60 + 50, 16 * 60 + 50)])
+        with self._at(14, 50):
+            assert sensor._compute_is_on()
+        with self._at(16, 51):
+            assert not sensor._compute_is_on()
+
+    def test_overnight_range(self):
+        """Une plage qui chevauche minuit couvre le soir et le petit matin."""
+        sensor = self._sensor([(22 * 60, 6 * 60)])
+        with self._at(23, 30):
+            assert sensor._compute_is_on()
+        with self._at(5, 59):
+            assert sensor._compute_is_on()
+        with self._at(12, 0):
+            assert not sensor._compute_is_on()
+
+    def test_no_range_is_off(self):
+        """Sans plage, le binaire reste à off."""
+        with self._at(3, 0):
+            assert not self._sensor([])._compute_is_on()
+
+    def test_next_boundary_is_range_start_or_minute_after_end(self):
+        """Le prochain réveil tombe au début d'une plage ou juste après sa fin."""
+        sensor = self._sensor([(22 * 60, 6 * 60), (14 * 60, 16 * 60)])
+        with self._at(7, 0):
+            assert sensor._next_boundary() == _local(date(2026, 1, 15), 14, 0)
+        with self._at(15, 0):
+            assert sensor._next_boundary() == _local(date(2026, 1, 15), 16, 1)
+        with self._at(23, 0):
+            assert sensor._next_boundary() == _local(date(2026, 1, 16), 6, 1)
+
+    def test_no_boundary_without_range(self):
+        """Sans plage, aucun réveil n'est programmé."""
+        assert self._sensor([])._next_boundary() is None
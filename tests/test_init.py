@@ -9,10 +9,15 @@ from unittest.mock import AsyncMock, patch
 
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.octopus_french import _async_ensure_device
 from custom_components.octopus_french.const import DOMAIN
-from custom_components.octopus_french.octopus_french import OctopusAuthError
+from custom_components.octopus_french.octopus_french import (
+    OctopusAuthError,
+    OctopusConnectionError,
+)
 
 _ENTRY_DATA = {
     "email": "user@example.fr",
@@ -138,3 +143,58 @@ async def test_configured_account_missing_fails_setup(
 
     assert entry.state is ConfigEntryState.SETUP_ERROR
     client.get_account_data.assert_not_awaited()
+
+
+async def test_accounts_connection_error_retries_setup(
+    recorder_mock, hass: HomeAssistant
+) -> None:
+    """Une erreur réseau sur la liste des comptes doit reporter le setup."""
+    entry = MockConfigEntry(domain=DOMAIN, data=_ENTRY_DATA, unique_id="A-123")
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.octopus_french.OctopusFrenchApiClient",
+    ) as mock_client_cls:
+        client = mock_client_cls.return_value
+        client.authenticate = AsyncMock(return_value=True)
+        client.get_accounts = AsyncMock(side_effect=OctopusConnectionError("boom"))
+        client.get_account_data = AsyncMock(return_value=dict(_ACCOUNT_DATA))
+
+        assert not await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.SETUP_RETRY
+    client.get_account_data.assert_not_awaited()
+
+
+async def test_ensure_device_skips_unchanged_and_updates_changed(
+    hass: HomeAssistant,
+) -> None:
+    """Un compteur inchangé n'écrit pas le registre ; un modèle modifié le met à jour."""
+    entry = MockConfigEntry(domain=DOMAIN, data=_ENTRY_DATA, unique_id="A-123")
+    entry.add_to_hass(hass)
+    device_registry = dr.async_get(hass)
+    device = {"name": "LINKY 123", "manufacturer": "Enedis", "model": "LINKY - 6 kVA"}
+
+    _async_ensure_device(device_registry, entry.entry_id, "123", **device)
+
+    with patch.object(
+        device_registry,
+        "async_get_or_create",
+        wraps=device_registry.async_get_or_create,
+    ) as get_or_create:
+        _async_ensure_device(device_registry, entry.entry_id, "123", **device)
+        get_or_create.assert_not_called()
+
+        _async_ensure_device(
+            device_registry,
+            entry.entry_id,
+            "123",
+            **device | {"model": "LINKY - 9 kVA"},
+        )
+        get_or_create.assert_called_once()
+
+    updated = device_registry.async_get_device(identifiers={(DOMAIN, "123")})
+    assert updated is not None
+    assert updated.model == "LINKY - 9 kVA"
+    assert entry.entry_id in updated.config_entries